@@ -0,0 +1,301 @@
+"""Headless bulk ingestion for Brahma.
+
+Walks a directory tree, loads every matching document with a pool of workers
+and embeds the chunks into the vector store. Progress is checkpointed after
+every batch, so an interrupted run picks up where it left off. The final line
+on stdout is a JSON summary for scripts and CI.
+
+Examples:
+    python ingest.py ./docs --workers 8
+    python ingest.py ./docs --include "*.pdf" --exclude "drafts/*"
+    python ingest.py ./docs --output /app/.vector_db   # prebuilt index for Docker
+    python ingest.py ./docs --dry-run                  # list what would be ingested
+"""
+import argparse
+import fnmatch
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from rag_engine import RAGEngine, DOCS_PATH, VECTOR_DB_PATH, SUPPORTED_EXTENSIONS
+
+CHECKPOINT_FILE = "ingest_checkpoint.json"
+DEFAULT_EXCLUDES = [".*", "__pycache__", "venv", "node_modules"]
+
+EXIT_OK = 0
+EXIT_FAILURES = 1
+EXIT_NO_FILES = 2
+EXIT_INTERRUPTED = 130
+
+
+def _matches(rel_path, patterns):
+    """True if the relative path, or any of its components, matches a pattern."""
+    parts = rel_path.split("/")
+    return any(
+        fnmatch.fnmatch(rel_path, pat) or any(fnmatch.fnmatch(part, pat) for part in parts)
+        for pat in patterns
+    )
+
+
+def _is_under(rel_path, prefix):
+    return prefix is not None and (rel_path == prefix or rel_path.startswith(prefix + "/"))
+
+
+def discover_files(root, includes, excludes, skip=None):
+    """Recursively lists files under root matching includes and not excludes.
+
+    skip is a path relative to root (e.g. the output index) that is left out
+    exactly, without being treated as a glob.
+    """
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+        rel_dir = "" if rel_dir == "." else rel_dir + "/"
+        # Prune excluded directories so we never descend into them
+        dirnames[:] = sorted(
+            d for d in dirnames
+            if not _matches(rel_dir + d, excludes) and not _is_under(rel_dir + d, skip)
+        )
+        for name in sorted(filenames):
+            rel_path = rel_dir + name
+            if _matches(rel_path, excludes) or _is_under(rel_path, skip):
+                continue
+            if any(fnmatch.fnmatch(rel_path, pat) or fnmatch.fnmatch(name, pat) for pat in includes):
+                found.append(rel_path)
+    return found
+
+
+def file_signature(path):
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def load_checkpoint(path):
+    """Returns {absolute file path: {"signature", "chunks"}} from a checkpoint."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("files", {})
+    except (OSError, ValueError) as e:
+        print(f"[WARN] Ignoring unreadable checkpoint {path}: {e}", file=sys.stderr)
+        return {}
+
+
+def save_checkpoint(path, files):
+    """Writes the checkpoint atomically so a crash never leaves it half-written."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"files": files}, f)
+    os.replace(tmp_path, path)
+
+
+def chunk_ids(path, count):
+    # Deterministic ids make re-ingesting a file an upsert rather than a duplicate.
+    # Absolute paths keep different roots ingested into one index from colliding.
+    return [f"{path}::{i}" for i in range(count)]
+
+
+def _format_eta(seconds):
+    seconds = int(seconds)
+    return f"{seconds // 3600:d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Recursively ingest documents into the Brahma vector store."
+    )
+    parser.add_argument("root", nargs="?", default=DOCS_PATH,
+                        help=f"Directory to ingest (default: DOCS_PATH={DOCS_PATH})")
+    parser.add_argument("--include", action="append", default=None, metavar="GLOB",
+                        help="Glob of files to ingest, repeatable (default: all supported types)")
+    parser.add_argument("--exclude", action="append", default=[], metavar="GLOB",
+                        help="Glob of files/directories to skip, repeatable "
+                             f"(always skipped: {', '.join(DEFAULT_EXCLUDES)})")
+    parser.add_argument("--workers", type=_positive_int, default=min(8, os.cpu_count() or 1),
+                        help="Number of parallel loader workers")
+    parser.add_argument("--batch-size", type=_positive_int, default=32,
+                        help="Files embedded and checkpointed per batch")
+    parser.add_argument("--output", default=VECTOR_DB_PATH,
+                        help=f"Vector store directory (default: VECTOR_DB_PATH={VECTOR_DB_PATH})")
+    parser.add_argument("--restart", action="store_true",
+                        help="Clear the index and checkpoint, then ingest everything again")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Only report which files would be ingested; build nothing")
+    parser.add_argument("--summary-file", default=None,
+                        help="Also write the JSON summary to this file")
+    args = parser.parse_args(argv)
+    if not os.path.isdir(args.root):
+        parser.error(f"root is not a directory: {args.root}")
+    return args
+
+
+def run(args):
+    root = os.path.abspath(args.root)
+    includes = args.include or [f"*{ext}" for ext in SUPPORTED_EXTENSIONS]
+    excludes = DEFAULT_EXCLUDES + args.exclude
+    output = os.path.abspath(args.output)
+    # Never ingest the index (or its checkpoint) into itself
+    output_rel = os.path.relpath(output, root).replace(os.sep, "/")
+    skip = None if output_rel == ".." or output_rel.startswith("../") else output_rel
+
+    checkpoint_path = os.path.join(output, CHECKPOINT_FILE)
+    done = {} if args.restart else load_checkpoint(checkpoint_path)
+
+    files = [
+        os.path.join(root, rel_path)
+        for rel_path in discover_files(root, includes, excludes, skip=skip)
+    ]
+    pending = []
+    for path in files:
+        entry = done.get(path)
+        if entry and entry.get("signature") == file_signature(path):
+            continue
+        pending.append(path)
+
+    summary = {
+        "status": "ok",
+        "root": root,
+        "output": output,
+        "files_found": len(files),
+        "files_skipped": len(files) - len(pending),
+        "files_ingested": 0,
+        "files_failed": 0,
+        "chunks_indexed": 0,
+        "failures": [],
+        "elapsed_seconds": 0.0,
+    }
+    print(f"Found {len(files)} files in {root}; {len(pending)} to ingest, "
+          f"{summary['files_skipped']} already done.", file=sys.stderr)
+
+    if not files:
+        # An empty match almost always means a wrong root or include glob
+        summary["status"] = "empty"
+        print("[WARN] No files matched; nothing was indexed.", file=sys.stderr)
+        return summary
+    if args.dry_run:
+        summary["status"] = "dry_run"
+        summary["files_pending"] = [os.path.relpath(path, root) for path in pending]
+        return summary
+    if not pending and not args.restart:
+        return summary
+
+    # Loading the embedding model is slow, so only do it once there is work
+    engine = RAGEngine(persist_directory=output)
+    if args.restart:
+        # Rebuild from scratch, dropping chunks of deleted or shrunken files too
+        engine.clear_index()
+        save_checkpoint(checkpoint_path, done)
+
+    def load(path):
+        signature = file_signature(path)
+        chunks = engine.split_documents(engine.load_file(path))
+        return signature, chunks
+
+    def flush(batch):
+        """Embeds a batch of loaded files with a single upsert, then checkpoints."""
+        chunks, ids, stale = [], [], []
+        for path, signature, file_chunks in batch:
+            # Drop chunks left over from a previous, longer version of the file
+            old_count = done.get(path, {}).get("chunks", 0)
+            stale.extend(chunk_ids(path, old_count)[len(file_chunks):])
+            chunks.extend(file_chunks)
+            ids.extend(chunk_ids(path, len(file_chunks)))
+        try:
+            engine.delete_chunks(stale)
+            engine.add_chunks(chunks, ids=ids)
+        except Exception as e:
+            for path, _, _ in batch:
+                fail(path, e)
+            return
+        for path, signature, file_chunks in batch:
+            done[path] = {"signature": signature, "chunks": len(file_chunks)}
+        summary["files_ingested"] += len(batch)
+        summary["chunks_indexed"] += len(chunks)
+        save_checkpoint(checkpoint_path, done)
+
+    def fail(path, error):
+        rel_path = os.path.relpath(path, root)
+        summary["files_failed"] += 1
+        summary["failures"].append({"file": rel_path, "error": str(error)})
+        print(f"    [Error] Failed to ingest {rel_path}: {error}", file=sys.stderr)
+
+    start = time.time()
+    processed = 0
+    reported = 0
+    queue = iter(pending)
+    in_flight = {}
+    loaded = []
+    pool = ThreadPoolExecutor(max_workers=args.workers)
+
+    def submit_next():
+        path = next(queue, None)
+        if path is not None:
+            in_flight[pool.submit(load, path)] = path
+
+    try:
+        # Keep up to a batch of loads queued beyond the workers, so the next
+        # batch loads while this one embeds without holding every file in memory
+        for _ in range(args.workers + args.batch_size):
+            submit_next()
+        while in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                path = in_flight.pop(future)
+                submit_next()
+                processed += 1
+                try:
+                    signature, chunks = future.result()
+                    loaded.append((path, signature, chunks))
+                except Exception as e:
+                    fail(path, e)
+
+            if processed - reported >= args.batch_size or not in_flight:
+                flush(loaded)
+                loaded = []
+                reported = processed
+                elapsed = time.time() - start
+                rate = processed / elapsed if elapsed else 0.0
+                eta = (len(pending) - processed) / rate if rate else 0.0
+                print(f"[{processed}/{len(pending)}] {rate:.1f} files/s, "
+                      f"{summary['chunks_indexed']} chunks, ETA {_format_eta(eta)}",
+                      file=sys.stderr)
+    except KeyboardInterrupt:
+        # Files loaded but not yet embedded are simply redone on the next run
+        summary["status"] = "interrupted"
+        print("Interrupted; progress saved. Re-run the same command to resume.", file=sys.stderr)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    summary["elapsed_seconds"] = round(time.time() - start, 2)
+    if summary["status"] == "ok" and summary["files_failed"]:
+        summary["status"] = "partial"
+    return summary
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    summary = run(args)
+    output = json.dumps(summary)
+    if args.summary_file:
+        with open(args.summary_file, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    print(output)
+    if summary["status"] == "interrupted":
+        return EXIT_INTERRUPTED
+    if summary["status"] == "empty":
+        return EXIT_NO_FILES
+    return EXIT_FAILURES if summary["files_failed"] else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
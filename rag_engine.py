@@ -1,4 +1,5 @@
 import os
+from functools import partial
 from langchain_community.document_loaders import PyPDFLoader, DirectoryLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_community.embeddings.fastembed import FastEmbedEmbeddings
@@ -14,41 +15,83 @@ DOCS_PATH = os.getenv("DOCS_PATH", ".")
 VECTOR_DB_PATH = os.getenv("VECTOR_DB_PATH", "./.vector_db")
 LOCAL_LLM_MODEL = "llama3" 
 CLOUD_LLM_MODEL = "gemini-1.5-flash" 
+# Legacy binary .doc (OLE2) is not supported: Docx2txtLoader only reads .docx zips
+SUPPORTED_EXTENSIONS = [".pdf", ".txt", ".docx", ".pptx", ".csv"]
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 100
+# Stay below Chroma's maximum batch size for a single upsert
+MAX_CHUNKS_PER_UPSERT = 5000
 
 class RAGEngine:
-    def __init__(self, provider="Ollama", api_key=None):
+    def __init__(self, provider="Ollama", api_key=None, persist_directory=VECTOR_DB_PATH):
         self.provider = provider
         self.api_key = api_key
+        self.persist_directory = persist_directory
         
         # Use FastEmbed for indexing (Local, Private, No Torch DLL issues)
         self.embeddings = FastEmbedEmbeddings(model_name="BAAI/bge-small-en-v1.5")
             
         self.vector_store = None
         
-        if not os.path.exists(VECTOR_DB_PATH):
-            os.makedirs(VECTOR_DB_PATH)
+        if not os.path.exists(self.persist_directory):
+            os.makedirs(self.persist_directory)
 
-    def load_and_index_documents(self):
-        """Loads various document types from the directory and indexes them."""
-        from langchain_text_splitters import RecursiveCharacterTextSplitter
+    def load_file(self, file_path):
+        """Loads a single document with the loader matching its extension."""
         from langchain_community.document_loaders import (
             PyPDFLoader, 
             TextLoader, 
             Docx2txtLoader, 
             UnstructuredPowerPointLoader,
-            CSVLoader,
-            DirectoryLoader
+            CSVLoader
         )
 
         loaders = {
             ".pdf": PyPDFLoader,
-            ".txt": TextLoader,
+            ".txt": partial(TextLoader, encoding='utf-8'),
             ".docx": Docx2txtLoader,
-            ".doc": Docx2txtLoader,
             ".pptx": UnstructuredPowerPointLoader,
             ".csv": CSVLoader,
         }
 
+        ext = os.path.splitext(file_path)[1].lower()
+        loader_cls = loaders.get(ext)
+        if loader_cls is None:
+            raise ValueError(f"Unsupported file type: {ext or file_path}")
+        return loader_cls(file_path).load()
+
+    def split_documents(self, documents):
+        """Splits loaded documents into chunks ready for embedding."""
+        text_splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+        return text_splitter.split_documents(documents)
+
+    def add_chunks(self, chunks, ids=None):
+        """Embeds chunks into the persistent vector store, creating it if needed."""
+        if not chunks:
+            return 0
+        if not self.vector_store and not self.get_existing_vector_store():
+            self.vector_store = Chroma(
+                persist_directory=self.persist_directory,
+                embedding_function=self.embeddings
+            )
+        for start in range(0, len(chunks), MAX_CHUNKS_PER_UPSERT):
+            end = start + MAX_CHUNKS_PER_UPSERT
+            self.vector_store.add_documents(chunks[start:end], ids=ids[start:end] if ids else None)
+        return len(chunks)
+
+    def delete_chunks(self, ids):
+        """Removes chunks by id, e.g. stale chunks of a file that changed."""
+        if ids and (self.vector_store or self.get_existing_vector_store()):
+            self.vector_store.delete(ids=ids)
+
+    def clear_index(self):
+        """Drops every chunk from the persistent vector store."""
+        if self.vector_store or self.get_existing_vector_store():
+            self.vector_store.delete_collection()
+            self.vector_store = None
+
+    def load_and_index_documents(self):
+        """Loads various document types from the directory and indexes them."""
         import glob
         
         documents = []
@@ -59,7 +102,6 @@ class RAGEngine:
         for ext in valid_extensions:
             # Find all files with this extension
             files = glob.glob(os.path.join(DOCS_PATH, f"*{ext}"))
-            loader_cls = loaders.get(ext)
             
             if not files:
                 continue
@@ -71,42 +113,28 @@ class RAGEngine:
                         continue
                         
                     print(f"  - Processing: {os.path.basename(file_path)}")
-                    # Load single file
-                    if ext == ".pdf":
-                        loader = PyPDFLoader(file_path)
-                    elif ext == ".txt":
-                        loader = TextLoader(file_path, encoding='utf-8')
-                    elif ext == ".csv":
-                        loader = CSVLoader(file_path)
-                    else:
-                        # Fallback for docx etc (DirectoryLoader style single file)
-                        # We use the class directly if it supports single file, mostly they do
-                        loader = loader_cls(file_path)
-                        
-                    docs = loader.load()
-                    documents.extend(docs)
+                    documents.extend(self.load_file(file_path))
                 except Exception as e:
                     print(f"    [Error] Failed to load {os.path.basename(file_path)}: {str(e)}")
         
         if not documents:
             return 0
 
-        text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-        chunks = text_splitter.split_documents(documents)
+        chunks = self.split_documents(documents)
         
         print(f"Indexing {len(chunks)} chunks using {self.provider}...")
         self.vector_store = Chroma.from_documents(
             documents=chunks, 
             embedding=self.embeddings, 
-            persist_directory=VECTOR_DB_PATH
+            persist_directory=self.persist_directory
         )
         return len(chunks)
 
     def get_existing_vector_store(self):
         """Loads the existing vector store if it exists."""
-        if os.path.exists(os.path.join(VECTOR_DB_PATH, "chroma.sqlite3")):
+        if os.path.exists(os.path.join(self.persist_directory, "chroma.sqlite3")):
             self.vector_store = Chroma(
-                persist_directory=VECTOR_DB_PATH, 
+                persist_directory=self.persist_directory, 
                 embedding_function=self.embeddings
             )
             return True
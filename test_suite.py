@@ -1,10 +1,71 @@
 import time
 import os
+import tempfile
 from rag_engine import RAGEngine
+import ingest
+
+def run_ingest_checks():
+    """Dry-runs the bulk ingester on a scratch tree; needs no models."""
+    with tempfile.TemporaryDirectory() as root:
+        for rel_path in ["notes.txt", "index.txt", "sub/indexing_notes.txt", "sub/deep/data.csv",
+                         "quarantine/bad.pdf", ".git/config.txt", "index/leftover.txt", "image.png"]:
+            path = os.path.join(root, *rel_path.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write("Brahma ingest check")
+        output = os.path.join(root, "index")
+        base_args = [root, "--output", output, "--exclude", "quarantine", "--dry-run"]
+
+        checks = []
+        summary = ingest.run(ingest.parse_args(base_args))
+        pending = sorted(p.replace(os.sep, "/") for p in summary["files_pending"])
+        # Recursive, skips hidden/excluded/unsupported files and the output dir,
+        # but keeps files that merely start with the output dir's name
+        checks.append(("recursive discovery", pending == [
+            "index.txt", "notes.txt", "sub/deep/data.csv", "sub/indexing_notes.txt"]))
+
+        summary = ingest.run(ingest.parse_args(base_args + ["--include", "*.csv"]))
+        checks.append(("include glob", summary["files_pending"] == [os.path.join("sub", "deep", "data.csv")]))
+
+        # Files recorded in the checkpoint with an unchanged signature are skipped
+        notes = os.path.join(root, "notes.txt")
+        done = {notes: {"signature": ingest.file_signature(notes), "chunks": 1}}
+        ingest.save_checkpoint(os.path.join(output, ingest.CHECKPOINT_FILE), done)
+        summary = ingest.run(ingest.parse_args(base_args))
+        checks.append(("checkpoint resume", summary["files_skipped"] == 1 and "notes.txt" not in summary["files_pending"]))
+        summary = ingest.run(ingest.parse_args(base_args + ["--restart"]))
+        checks.append(("restart ignores checkpoint", summary["files_skipped"] == 0))
+
+        with open(notes, "a") as f:
+            f.write(" changed")
+        summary = ingest.run(ingest.parse_args(base_args))
+        checks.append(("changed file re-ingested", "notes.txt" in summary["files_pending"]))
+
+        checks.append(("chunk ids", ingest.chunk_ids(notes, 2) == [f"{notes}::0", f"{notes}::1"]))
+        checks.append(("dry run exits 0", ingest.main(base_args) == ingest.EXIT_OK))
+        checks.append(("no matches exits 2", ingest.main(base_args + ["--include", "*.xyz"]) == ingest.EXIT_NO_FILES))
+        for bad_args in (["--batch-size", "0"], ["--workers", "-1"]):
+            try:
+                ingest.parse_args(base_args + bad_args)
+                checks.append((f"rejects {' '.join(bad_args)}", False))
+            except SystemExit:
+                checks.append((f"rejects {' '.join(bad_args)}", True))
+
+    all_ok = True
+    for name, ok in checks:
+        print(f"   [{'OK' if ok else 'FAIL'}] {name}")
+        all_ok = all_ok and ok
+    return all_ok
 
 def run_test_suite():
     print("--- Starting Brahma AI Test Suite ---")
     
+    # 0. Bulk ingest CLI (no models needed)
+    print("\n[0/3] Checking bulk ingest CLI...")
+    if not run_ingest_checks():
+        print("[ERROR] Bulk ingest checks failed.")
+        return
+
     # 1. Initialize Engine
     print("\n[1/3] Initializing RAGEngine...")
     try: